@@ -1,22 +1,33 @@
-import ast
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # Numba là tùy chọn, không có thì dùng NumPy
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _accumulate(starts, ends, qubits, diff):
+        """Cộng qubits vào mảng hiệu tại start, trừ tại end + 1 (mã máy biên dịch bởi Numba)."""
+        for i in range(starts.shape[0]):
+            diff[starts[i]] += qubits[i]
+            diff[ends[i] + 1] -= qubits[i]
+else:
+    def _accumulate(starts, ends, qubits, diff):
+        """Cộng qubits vào mảng hiệu tại start, trừ tại end + 1 (NumPy)."""
+        np.add.at(diff, starts, qubits)
+        np.add.at(diff, ends + 1, -qubits)
+
 def read_dataframe_from_txt(file_path: str) -> pd.DataFrame:
-    """Đọc file .txt chứa dữ liệu dạng dictionary từng dòng và chuyển thành DataFrame."""
-    data = []
+    """Đọc file .txt chứa dữ liệu dạng JSON từng dòng (JSON lines) và chuyển thành DataFrame."""
     try:
         with open(file_path, "r", encoding="utf-8") as file:
-            for line in file:
-                line = line.strip()
-                if line:  # Bỏ qua dòng trống
-                    data.append(ast.literal_eval(line))  # Chuyển đổi chuỗi thành dictionary
-
-        return pd.DataFrame(data)
+            return pd.read_json(file, lines=True)  # Bộ phân tích JSON của pandas (C) đọc thẳng thành cột
     except FileNotFoundError:
         raise FileNotFoundError(f"Error: File '{file_path}' not found.")
-    except (SyntaxError, ValueError):
+    except ValueError:
         raise ValueError(f"Error: File '{file_path}' chứa dữ liệu không hợp lệ.")
 
 def plot_total_qubit_utilization(df: pd.DataFrame, output_file="utilization_plot.pdf"):
@@ -30,20 +41,24 @@ def plot_total_qubit_utilization(df: pd.DataFrame, output_file="utilization_plot
     # Tính tổng capacity của toàn hệ thống (tổng capacity của tất cả các máy)
     total_capacity = df.groupby("machine")["capacity"].max().sum()
 
-    # Tạo mảng theo dõi tổng số qubit sử dụng theo từng thời điểm
-    total_timeline = np.zeros(final_time + 1)
-
-    # Cập nhật số qubit sử dụng trong từng khoảng thời gian
-    for _, row in df.iterrows():
-        start, end, qubits = int(row["start"]), int(row["end"]), row["qubits"]
-        total_timeline[start:end + 1] += qubits  # Cộng dồn số qubit vào từng thời điểm
+    # Cập nhật số qubit sử dụng trong từng khoảng thời gian bằng mảng hiệu (difference array):
+    # cộng qubits tại start, trừ tại end + 1, sau đó cộng dồn (cumsum) để ra timeline
+    starts = df["start"].to_numpy(np.int64)
+    ends = df["end"].to_numpy(np.int64)
+    qubits = df["qubits"].to_numpy(np.float64)
+    diff = np.zeros(final_time + 2)
+    _accumulate(starts, ends, qubits, diff)
+    total_timeline = np.cumsum(diff, out=diff)[:final_time + 1]
 
     # Chuyển đổi thành phần trăm (%) dựa trên tổng capacity của hệ thống
     utilization_percentage = (total_timeline / total_capacity) * 100  # Đổi sang %
 
+    # Xác định trục X theo thời gian (từ 0 đến final_time)
+    time_steps = np.arange(final_time + 1)
+
     # Vẽ biểu đồ đường
     plt.figure(figsize=(10, 5))
-    plt.plot(range(final_time + 1), utilization_percentage, marker='o', linestyle='-', label="Total Utilization (%)")
+    plt.plot(time_steps, utilization_percentage, marker='o', markevery=max(1, len(time_steps) // 50), linestyle='-', label="Total Utilization (%)")  # Chỉ vẽ tối đa ~50 điểm đánh dấu
 
     plt.xlabel("Time Step")
     plt.ylabel("Total Qubit Utilization (%)")
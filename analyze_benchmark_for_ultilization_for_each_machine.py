@@ -1,22 +1,33 @@
-import ast
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # Numba là tùy chọn, không có thì dùng NumPy
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _accumulate(starts, ends, qubits, diff):
+        """Cộng qubits vào mảng hiệu tại start, trừ tại end + 1 (mã máy biên dịch bởi Numba)."""
+        for i in range(starts.shape[0]):
+            diff[starts[i]] += qubits[i]
+            diff[ends[i] + 1] -= qubits[i]
+else:
+    def _accumulate(starts, ends, qubits, diff):
+        """Cộng qubits vào mảng hiệu tại start, trừ tại end + 1 (NumPy)."""
+        np.add.at(diff, starts, qubits)
+        np.add.at(diff, ends + 1, -qubits)
+
 def read_dataframe_from_txt(file_path: str) -> pd.DataFrame:
-    """Đọc file .txt chứa dữ liệu dạng dictionary từng dòng và chuyển thành DataFrame."""
-    data = []
+    """Đọc file .txt chứa dữ liệu dạng JSON từng dòng (JSON lines) và chuyển thành DataFrame."""
     try:
         with open(file_path, "r", encoding="utf-8") as file:
-            for line in file:
-                line = line.strip()
-                if line:  # Bỏ qua dòng trống
-                    data.append(ast.literal_eval(line))  # Chuyển đổi chuỗi thành dictionary
-
-        return pd.DataFrame(data)
+            return pd.read_json(file, lines=True)  # Bộ phân tích JSON của pandas (C) đọc thẳng thành cột
     except FileNotFoundError:
         raise FileNotFoundError(f"Error: File '{file_path}' not found.")
-    except (SyntaxError, ValueError):
+    except ValueError:
         raise ValueError(f"Error: File '{file_path}' chứa dữ liệu không hợp lệ.")
 
 def plot_machine_qubit_utilization(df: pd.DataFrame, output_file="machine_utilization_plot.pdf"):
@@ -25,19 +36,24 @@ def plot_machine_qubit_utilization(df: pd.DataFrame, output_file="machine_utiliz
         raise ValueError("Error: DataFrame is empty.")
 
     # Xác định danh sách các máy và tổng capacity của mỗi máy
-    machines = df["machine"].unique()
-    machine_capacity = {machine: df[df["machine"] == machine]["capacity"].iloc[0] for machine in machines}
+    machine_capacity = df.groupby("machine", sort=False)["capacity"].first().to_dict()  # Một lần groupby thay vì lọc theo từng máy
+    machines = list(machine_capacity)
 
     # Xác định thời điểm cuối cùng mà các job hoàn thành
     final_time = int(df["end"].max())
 
     # Dictionary để lưu qubit utilization theo thời gian của từng máy
-    machine_timeline = {machine: np.zeros(final_time + 2) for machine in machines}  # +2 để tính khoảng thời gian đúng
+    machine_timeline = {}
 
-    # Cập nhật số qubit sử dụng trong từng khoảng thời gian cho mỗi máy
-    for _, row in df.iterrows():
-        start, end, qubits, machine = int(row["start"]), int(row["end"]), row["qubits"], row["machine"]
-        machine_timeline[machine][start:end + 1] += qubits  # Cộng dồn số qubit vào từng thời điểm
+    # Cập nhật số qubit sử dụng trong từng khoảng thời gian cho mỗi máy bằng mảng hiệu
+    # (difference array): cộng qubits tại start, trừ tại end + 1, sau đó cumsum
+    for machine, group in df.groupby("machine", sort=False):
+        starts = group["start"].to_numpy(np.int64)
+        ends = group["end"].to_numpy(np.int64)
+        qubits = group["qubits"].to_numpy(np.float64)
+        diff = np.zeros(final_time + 3)  # +2 để tính khoảng thời gian đúng, +1 cho end + 1
+        _accumulate(starts, ends, qubits, diff)
+        machine_timeline[machine] = np.cumsum(diff, out=diff)[:final_time + 2]
 
     # Chuyển đổi sang phần trăm (%) dựa trên capacity của máy
     for machine in machines:
@@ -51,7 +67,7 @@ def plot_machine_qubit_utilization(df: pd.DataFrame, output_file="machine_utiliz
     plt.figure(figsize=(10, 5))
 
     for machine, timeline in machine_timeline.items():
-        plt.plot(time_steps, timeline, marker='o', linestyle='-', label=f"Utilization - {machine} (%)")
+        plt.plot(time_steps, timeline, marker='o', markevery=max(1, len(time_steps) // 50), linestyle='-', label=f"Utilization - {machine} (%)")  # Chỉ vẽ tối đa ~50 điểm đánh dấu
 
     plt.xlabel("Time")
     plt.ylabel("Qubit Utilization (%)")
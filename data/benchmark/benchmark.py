@@ -1,4 +1,6 @@
 """Generates the benchmark data."""
+from functools import lru_cache
+
 from mqt.bench import get_benchmark
 from qiskit import QuantumCircuit
 import numpy as np
@@ -11,6 +13,7 @@ from src.scheduling import (
     SchedulerType,
     STimes,
     generate_schedule,
+    set_up_base_lp,
 )
 from src.utils.helpers import Timer
 
@@ -20,12 +23,17 @@ def _generate_batch(max_qubits: int, circuits_per_batch: int) -> list[QuantumCir
     batch = []
     for _ in range(circuits_per_batch):
         size = np.random.randint(2, max_qubits + 1)
-        circuit = get_benchmark(benchmark_name="random", level=0, circuit_size=size)
-        batch.append(circuit)
+        batch.append(_get_random_circuit(size).copy())
 
     return batch
 
 
+@lru_cache(maxsize=None)
+def _get_random_circuit(size: int) -> QuantumCircuit:
+    # The random benchmark is generated with a fixed seed, so it only depends on size
+    return get_benchmark(benchmark_name="random", level=0, circuit_size=size)
+
+
 def run_experiments(
     circuits_per_batch: int,
     settings: list[dict[str, int]],
@@ -63,15 +71,10 @@ def run_experiments(
         ]
         benchmark_results: list[dict[str, PTimes | STimes | dict[str, Result]]] = []
         for benchmark in benchmarks:
-            # lp_instance = set_up_base_lp(
-            #     benchmark, setting, big_m=1000, timesteps=list(range(t_max))
-            # )
             p_times = _get_benchmark_processing_times(benchmark, setting, get_integers)
             s_times = _get_benchmark_setup_times(
                 benchmark, setting, default_value=2**5, get_integers=get_integers
             )
-            print(f"Processing times: {p_times}")
-            print(f"Setup times: {s_times}")
             problem = InfoProblem(
                 base_jobs=benchmark,
                 accelerators=setting,
@@ -87,16 +90,26 @@ def run_experiments(
                 makespan, jobs, _ = generate_schedule(problem, SchedulerType.BASELINE)
             result["baseline"] = Result(makespan, jobs, t0.elapsed)
 
-            # Run the simple model
+            # Set up the base LP once, both models extend a copy of it
+            # Its set up time is accounted to both models
+            with Timer() as t_base:
+                base_lp = set_up_base_lp(
+                    benchmark, setting, big_m=problem.big_m, timesteps=t_max
+                )
 
+            # Run the simple model
             with Timer() as t1:
-                makespan, jobs, _ = generate_schedule(problem, SchedulerType.SIMPLE)
-            result["simple"] = Result(makespan, jobs, t1.elapsed)
+                makespan, jobs, _ = generate_schedule(
+                    problem, SchedulerType.SIMPLE, base_lp
+                )
+            result["simple"] = Result(makespan, jobs, t_base.elapsed + t1.elapsed)
 
             # Run the extended model
             with Timer() as t2:
-                makespan, jobs, _ = generate_schedule(problem, SchedulerType.EXTENDED)
-            result["extended"] = Result(makespan, jobs, t2.elapsed)
+                makespan, jobs, _ = generate_schedule(
+                    problem, SchedulerType.EXTENDED, base_lp
+                )
+            result["extended"] = Result(makespan, jobs, t_base.elapsed + t2.elapsed)
 
             # Store results
             benchmark_results.append(
@@ -112,12 +125,13 @@ def _get_benchmark_processing_times(
     accelerators: dict[str, int],
     get_integers: bool = False,
 ) -> PTimes:
-    return [
-        [np.random.randint(0, 3) + job.num_qubits // 2 for _ in accelerators]
-        if get_integers
-        else [np.random.random() * 10 + job.num_qubits / 5 for _ in accelerators]
-        for job in base_jobs
-    ]
+    counts = np.array([job.num_qubits for job in base_jobs], dtype=np.int64)[:, None]
+    offsets = counts // 2 if get_integers else counts / 5
+    shape = (len(base_jobs), len(accelerators))
+    # One draw per cell in row-major order, like the former per-cell loop
+    if get_integers:
+        return (np.random.randint(0, 3, size=shape) + offsets).tolist()
+    return (np.random.random(shape) * 10 + offsets).tolist()
 
 
 def _get_benchmark_setup_times(
@@ -125,28 +139,22 @@ def _get_benchmark_setup_times(
     accelerators: dict[str, int],
     default_value: float,
     get_integers: bool = False,
-) -> STimes:
-    return [
-        [
-            [
-                default_value
-                if id_i in [id_j, 0]
-                else 0
-                if job_j is None
-                else _calc_setup_times(job_i, job_j, get_integers)
-                for _ in accelerators
-            ]
-            for id_i, job_i in enumerate([None] + base_jobs)
-        ]
-        for id_j, job_j in enumerate([None] + base_jobs)
-    ]
-
-
-def _calc_setup_times(
-    job_i: QuantumCircuit,
-    job_j: QuantumCircuit,
-    get_integers: bool = False,
-) -> float:
+) -> np.ndarray:
+    # Index 0 is the dummy start job, indexing is [job_j][job_i][accelerator]
+    counts = np.array([0] + [job.num_qubits for job in base_jobs], dtype=np.int64)
+    qubit_sums = (counts[:, None] + counts[None, :])[:, :, None]
+    offsets = qubit_sums // 8 if get_integers else qubit_sums / 10
+    shape = (len(base_jobs) + 1, len(base_jobs) + 1, len(accelerators))
+    id_j, id_i = np.indices(shape[:2])
+    setup_times = np.zeros(shape, dtype=np.result_type(default_value, offsets))
+    setup_times[(id_i == 0) | (id_i == id_j)] = default_value
+    # Only the real job pairs are drawn, in the same C order as the former
+    # per-cell loop, so a seed still generates the same benchmark instances
+    drawn = (id_i != 0) & (id_i != id_j) & (id_j != 0)
+    n_drawn = np.count_nonzero(drawn) * len(accelerators)
     if get_integers:
-        return np.random.randint(0, 2) + (job_i.num_qubits + job_j.num_qubits) // 8
-    return np.random.random() * 10 + (job_i.num_qubits + job_j.num_qubits) / 10
+        noise = np.random.randint(0, 2, size=n_drawn)
+    else:
+        noise = np.random.random(n_drawn) * 10
+    setup_times[drawn] = noise.reshape(-1, len(accelerators)) + offsets[drawn]
+    return setup_times
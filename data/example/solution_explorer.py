@@ -11,6 +11,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 from matplotlib import ticker
+from matplotlib.figure import Figure
 from matplotlib.patches import Patch
 
 
@@ -46,15 +47,33 @@ def _read_solution_file(solution_file: str) -> pd.DataFrame:
     job_capacities = params.get("job_capcities", {})
     machine_capacities = params.get("machine_capacities", {})
 
-    rows_list = []
+    # Đánh chỉ mục `variables` một lần: thời gian bắt đầu, kết thúc và máy được gán theo index job
+    starts, ends, assignments = {}, {}, {}
+    for key, value in variables.items():
+        if key.startswith("s_j_"):
+            starts[key[4:]] = value
+        elif key.startswith("c_j_"):
+            ends[key[4:]] = value
+        elif key.startswith("x_ik_") and value >= 0.5:
+            job_index, machine = key[5:].split("_", 1)
+            if machine in machines:
+                assignments.setdefault(job_index, machine)
+
+    # Gom dữ liệu theo từng cột để dựng DataFrame trực tiếp
+    columns = {
+        "job": [],
+        "qubits": [],
+        "machine": [],
+        "capacity": [],
+        "start": [],
+        "end": [],
+        "duration": [],
+    }
     
-    for job in jobs:
+    for job_index, job in enumerate(jobs, start=1):  # Vì job có index từ 1
         # Tìm thời gian bắt đầu và kết thúc từ `variables`
-        start_key = f"s_j_{jobs.index(job) + 1}"  # Vì job có index từ 1
-        end_key = f"c_j_{jobs.index(job) + 1}"
-
-        start = variables.get(start_key, None)
-        end = variables.get(end_key, None)
+        start = starts.get(str(job_index), None)
+        end = ends.get(str(job_index), None)
 
         if start is None or end is None:
             print(f"Warning: Missing start or end time for job {job}. Skipping...")
@@ -63,12 +82,7 @@ def _read_solution_file(solution_file: str) -> pd.DataFrame:
         duration = end - start
 
         # Xác định máy được gán từ `variables`
-        assigned_machine = None
-        for machine in machines:
-            machine_key = f"x_ik_{jobs.index(job) + 1}_{machine}"
-            if variables.get(machine_key, 0) >= 0.5:
-                assigned_machine = machine
-                break
+        assigned_machine = assignments.get(str(job_index), None)
         
         if assigned_machine is None:
             print(f"Warning: No machine assigned for job {job}. Skipping...")
@@ -76,23 +90,19 @@ def _read_solution_file(solution_file: str) -> pd.DataFrame:
 
         capacity = machine_capacities.get(assigned_machine, None)
 
-        # Thêm dữ liệu vào danh sách
-        rows_list.append({
-            "job": job,
-            "qubits": job_capacities.get(job, None),
-            "machine": assigned_machine,
-            "capacity": capacity,
-            "start": start,
-            "end": end,
-            "duration": duration,
-        })
-
-    # Chuyển đổi danh sách thành DataFrame
-    df = pd.DataFrame(rows_list)
-    # Save rows_list to a file
-    with open('job_data.txt', 'w') as f:
-        for item in rows_list:
-            f.write("%s\n" % item)
+        # Thêm dữ liệu vào từng cột
+        columns["job"].append(job)
+        columns["qubits"].append(job_capacities.get(job, None))
+        columns["machine"].append(assigned_machine)
+        columns["capacity"].append(capacity)
+        columns["start"].append(start)
+        columns["end"].append(end)
+        columns["duration"].append(duration)
+
+    # Chuyển đổi các cột thành DataFrame
+    df = pd.DataFrame(columns)
+    # Save the rows to a file as JSON lines, missing values are written as null
+    df.to_json('job_data.txt', orient="records", lines=True)
     return df
 
 
@@ -112,27 +122,32 @@ def generate_schedule_plot(solution_file: str, pdf_name: str | None = None):
     df = _read_solution_file(solution_file)
     print(df)
 
+    # Capacity per machine in order of appearance, drives colors and legend
+    capacities = df.groupby("machine", sort=False)["capacity"].first()
+
     # Create a color mapping for the machines
     machine_colors = ["#154060", "#98c6ea", "#527a9c"]
-    color_mapping = dict(zip(df["machine"].unique(), machine_colors))
+    color_mapping = dict(zip(capacities.index, machine_colors))
 
     # Plot the jobs
     # The grid lines are at the start of a time step.
     # Hence, if a job ends in time step 11, the bar ends at 12.
-    _, ax = plt.subplots()
-
-    for i, row in df.iterrows():
-        padding = 0.1
-        height = 1 - 2 * padding
-        ax.barh(
-            i,
-            row["duration"],
-            left=row["start"],
-            height=height,
-            edgecolor="black",
-            linewidth=2,
-            color=color_mapping[row["machine"]],
-        )
+    # A PDF is rendered on a standalone figure, which leaves pyplot's
+    # backend and open figures untouched
+    fig = Figure() if pdf_name else plt.figure()
+    ax = fig.subplots()
+
+    padding = 0.1
+    height = 1 - 2 * padding
+    ax.barh(
+        np.arange(len(df)),
+        df["duration"].to_numpy(),
+        left=df["start"].to_numpy(),
+        height=height,
+        edgecolor="black",
+        linewidth=2,
+        color=df["machine"].map(color_mapping).to_numpy(),
+    )
 
     # Create patches for the legend
     patches = []
@@ -153,22 +168,18 @@ def generate_schedule_plot(solution_file: str, pdf_name: str | None = None):
     ax.invert_yaxis()
 
     # Set the axis labels
-    plt.xlabel("Time")
-    plt.grid(axis="x", which="major")
-    plt.grid(axis="x", which="minor", alpha=0.4)
+    ax.set_xlabel("Time")
+    ax.grid(axis="x", which="major")
+    ax.grid(axis="x", which="minor", alpha=0.4)
 
-    legend_labels = list(color_mapping.keys())
     # Print the legend labels with name and capacity
-    legend_labels = [
-        f"{label} ({df[df['machine'] == label]['capacity'].iloc[0]})"
-        for label in legend_labels
-    ]
+    legend_labels = [f"{label} ({capacities[label]})" for label in color_mapping]
     
-    plt.legend(handles=patches, labels=legend_labels)
+    ax.legend(handles=patches, labels=legend_labels)
 
     if pdf_name:
-        plt.tight_layout()
-        plt.savefig(pdf_name, format="pdf", bbox_inches="tight")
+        fig.tight_layout()
+        fig.savefig(pdf_name, format="pdf", bbox_inches="tight")
     else:
         plt.show()
 
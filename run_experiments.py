@@ -3,17 +3,19 @@ from dataclasses import is_dataclass, asdict
 from typing import Any
 import json
 
-# import numpy as np
+import numpy as np
 
 from data.benchmark import run_experiments, analyze_benchmarks
 
 
 class DataclassJSONEncoder(json.JSONEncoder):
-    """Helper to serialize dataclasses."""
+    """Helper to serialize dataclasses and numpy arrays."""
 
     def default(self, o) -> dict[str, Any] | Any:
         if is_dataclass(o):
             return asdict(o)
+        if isinstance(o, np.ndarray):
+            return o.tolist()
         return super().default(o)
 
 
@@ -1,12 +1,11 @@
+import csv
 import json
-import pandas as pd
 
 def save_benchmark_to_csv(json_file: str, csv_file: str):
     """Reads benchmark data from a JSON file and saves it to a CSV file with dynamic algorithm detection."""
     with open(json_file, "r", encoding="utf-8") as f:
         data = json.load(f)
 
-    csv_data = []
     algorithm_names = set()  # Store all detected algorithm names dynamically
 
     # Identify all algorithm types from the first benchmark
@@ -19,30 +18,35 @@ def save_benchmark_to_csv(json_file: str, csv_file: str):
 
     # Convert set to sorted list to maintain order
     algorithm_names = sorted(algorithm_names)
+    fieldnames = (
+        ["Setting"]
+        + [f"{algo} makespan" for algo in algorithm_names]
+        + [f"{algo} time" for algo in algorithm_names]
+    )
 
-    for setting_data in data:
-        setting = setting_data["setting"]  # Extract setting as a dictionary
-        benchmarks = setting_data["benchmarks"]  # List of benchmarks
+    # Write each row directly instead of collecting them in a DataFrame first
+    with open(csv_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
+        writer.writeheader()
+
+        for setting_data in data:
+            setting = json.dumps(setting_data["setting"])  # Store setting as a JSON string
+            benchmarks = setting_data["benchmarks"]  # List of benchmarks
 
-        for benchmark in benchmarks:
-            results = benchmark["results"]
+            for benchmark in benchmarks:
+                results = benchmark["results"]
 
-            row = {"Setting": json.dumps(setting)}  # Store setting as a JSON string
+                row = {"Setting": setting}
 
-            # Dynamically extract makespan and computation time for all algorithms
-            for algo in algorithm_names:
-                row[f"{algo} makespan"] = results[algo]["makespan"]
-                
-            for algo in algorithm_names:
-                row[f"{algo} time"] = results[algo]["time"]
+                # Dynamically extract makespan and computation time for all algorithms
+                for algo in algorithm_names:
+                    row[f"{algo} makespan"] = results[algo]["makespan"]
 
-            csv_data.append(row)
+                for algo in algorithm_names:
+                    row[f"{algo} time"] = results[algo]["time"]
 
-    # Convert list to DataFrame
-    df = pd.DataFrame(csv_data)
+                writer.writerow(row)
 
-    # Save to CSV
-    df.to_csv(csv_file, index=False)
     print(f"Saved benchmark results to {csv_file}")
     
 # Usage
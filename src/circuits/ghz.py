@@ -2,9 +2,10 @@
 from functools import lru_cache
 
 from qiskit import QuantumCircuit
+from qiskit.circuit import CircuitInstruction, Measure
+from qiskit.circuit.library import CXGate, HGate
 
 
-@lru_cache
 def create_ghz(n_qubits: int) -> QuantumCircuit:
     """Generates a n-qubit GHZ state.
 
@@ -15,15 +16,9 @@ def create_ghz(n_qubits: int) -> QuantumCircuit:
     Returns:
         QuantumCircuit: The quantum circuit object.
     """
-    circuit = QuantumCircuit(n_qubits, n_qubits)
-    circuit.h(0)
-    for i in range(n_qubits - 1):
-        circuit.cx(i, i + 1)
-    circuit.measure(list(range(n_qubits)), list(range(n_qubits)))
-    return circuit
+    return _build_ghz(n_qubits).copy()
 
 
-@lru_cache
 def create_quantum_only_ghz(n_qubits: int) -> QuantumCircuit:
     """Generater a n-qubit GHZ state.
 
@@ -34,8 +29,29 @@ def create_quantum_only_ghz(n_qubits: int) -> QuantumCircuit:
     Returns:
         QuantumCircuit: The quantum circuit object.
     """
+    return _build_quantum_only_ghz(n_qubits).copy()
+
+
+# The cached circuits are never handed out directly, callers get a copy
+# so mutating a returned circuit cannot corrupt the cache.
+@lru_cache
+def _build_ghz(n_qubits: int) -> QuantumCircuit:
+    circuit = QuantumCircuit(n_qubits, n_qubits)
+    circuit.compose(_build_quantum_only_ghz(n_qubits), inplace=True)
+    measure = Measure()
+    for qubit, clbit in zip(circuit.qubits, circuit.clbits):
+        circuit._append(CircuitInstruction(measure, (qubit,), (clbit,)))
+    return circuit
+
+
+@lru_cache
+def _build_quantum_only_ghz(n_qubits: int) -> QuantumCircuit:
     circuit = QuantumCircuit(n_qubits)
-    circuit.h(0)
-    for i in range(n_qubits - 1):
-        circuit.cx(i, i + 1)
+    # Append the instructions directly, the arguments are valid by construction
+    # and skipping the builder's broadcasting and checks per gate is much faster
+    qubits = circuit.qubits
+    circuit._append(CircuitInstruction(HGate(), (qubits[0],)))
+    cx_gate = CXGate()
+    for control, target in zip(qubits, qubits[1:]):
+        circuit._append(CircuitInstruction(cx_gate, (control, target)))
     return circuit
@@ -24,10 +24,11 @@ class Experiment:
     uuid: UUID
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CircuitJob:
     """Data class for single cicruit.
     The circuit is enriched with information for reconstruction.
+    Circuit jobs are immutable, use `dataclasses.replace` to derive a new one.
     """
 
     coefficient: tuple[float, WeightType] | None
@@ -41,7 +42,7 @@ class CircuitJob:
     uuid: UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class CombinedJob:
     """Data class for combined circuit object.
     Order of the lists has to be correct for all!
@@ -100,18 +101,24 @@ def jobs_from_experiment(experiment: Experiment) -> list[CircuitJob]:
     Returns:
         list[CircuitJob]: A list of job wrappers for all circuits.
     """
+    n_shots = experiment.n_shots
+    observables = experiment.observables
+    partition_label = experiment.partition_label
+    uuid = experiment.uuid
     return [
         CircuitJob(
-            coefficient=experiment.coefficients[idx],
+            coefficient=coefficient,
             cregs=len(circuit.cregs),
             index=idx,
             circuit=circuit,
-            n_shots=experiment.n_shots,
+            n_shots=n_shots,
             # TODO this might need to change for proper observables
-            observable=experiment.observables,
-            partition_label=experiment.partition_label,
+            observable=observables,
+            partition_label=partition_label,
             result_counts=None,
-            uuid=experiment.uuid,
+            uuid=uuid,
+        )
+        for idx, (circuit, coefficient) in enumerate(
+            zip(experiment.circuits, experiment.coefficients)
         )
-        for idx, circuit in enumerate(experiment.circuits)
     ]
@@ -1,25 +1,98 @@
 """Wrapper for IBMs backend simulator."""
+from collections import OrderedDict
+from functools import lru_cache
 from uuid import UUID, uuid4
 
 from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Barrier
+from qiskit.circuit.library import get_standard_gate_name_mapping
 from qiskit_aer import AerSimulator
 
 from src.common import IBMQBackend
 from src.tools import optimize_circuit_online
 
 
+# Instantiating a fake backend and extracting its noise model is expensive.
+# There are only a few backends, so share one instance of each across accelerators.
+@lru_cache(maxsize=8)
+def _backend_for(backend: IBMQBackend):
+    return backend.value()
+
+
+@lru_cache(maxsize=8)
+def _simulator_for(backend: IBMQBackend) -> AerSimulator:
+    return AerSimulator.from_backend(_backend_for(backend))
+
+
+@lru_cache(maxsize=8)
+def _qubits_for(backend: IBMQBackend) -> int:
+    return len(_simulator_for(backend).properties().qubits)
+
+
+# Operations whose behaviour is fully described by their name and parameters.
+# Custom gates and opaque instructions can share a name with different
+# definitions, circuits containing them are not cached.
+_STANDARD_OPERATIONS = {
+    name: type(operation)
+    for name, operation in get_standard_gate_name_mapping().items()
+} | {"barrier": Barrier}
+
+# Number of processing times kept per accelerator
+_PROCESSING_TIMES_SIZE = 1024
+
+
+def _circuit_key(circuit: QuantumCircuit) -> tuple | None:
+    """Builds a hashable key describing the structure of a circuit.
+
+    Two circuits with the same key consist of the same operations on the same
+    bit indices and therefore compile to the same result.
+    Args:
+        circuit (QuantumCircuit): The circuit to describe.
+
+    Returns:
+        tuple | None: The structural key or None if the circuit contains
+            non-standard operations or unhashable parameters.
+    """
+    qubit_indices = {qubit: idx for idx, qubit in enumerate(circuit.qubits)}
+    clbit_indices = {clbit: idx for idx, clbit in enumerate(circuit.clbits)}
+    instructions = []
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if _STANDARD_OPERATIONS.get(operation.name) is not type(operation):
+            return None
+        # Parameters are compared by value, not by their summarized string
+        params = tuple(operation.params)
+        try:
+            hash(params)
+        except TypeError:
+            return None
+        instructions.append(
+            (
+                operation.name,
+                params,
+                getattr(operation, "unit", None),
+                tuple(qubit_indices[qubit] for qubit in instruction.qubits),
+                tuple(clbit_indices[clbit] for clbit in instruction.clbits),
+                str(getattr(operation, "condition", None)),
+            )
+        )
+    return circuit.num_qubits, circuit.num_clbits, tuple(instructions)
+
+
 class Accelerator:
     """Wrapper for a single backend simulator."""
 
     def __init__(
         self, backend: IBMQBackend, shot_time: int = 1, reconfiguration_time: int = 0
     ) -> None:
-        self.simulator = AerSimulator.from_backend(backend.value())
+        self.simulator = _simulator_for(backend)
         self._backend = backend
-        self._qubits = len(self.simulator.properties().qubits)
+        self._qubits = _qubits_for(backend)
         self._shot_time = shot_time
         self._reconfiguration_time = reconfiguration_time
         self._uuid = uuid4()
+        # Processing times by circuit structure, see compute_processing_time
+        self._processing_times: OrderedDict[tuple, float] = OrderedDict()
 
     @staticmethod
     def _time_conversion(
@@ -67,11 +140,22 @@ class Accelerator:
         """
         # TODO: doing a full hardware-aware compilation just to get the processing
         # time is not efficient. An approximation would be better.
-        be = self._backend.value()
+        # Structurally identical circuits are only compiled once per accelerator.
+        key = _circuit_key(circuit)
+        if key in self._processing_times:
+            self._processing_times.move_to_end(key)
+            return self._processing_times[key]
+        be = _backend_for(self._backend)
         transpiled_circuit = transpile(circuit, be, scheduling_method="alap")
-        return Accelerator._time_conversion(
+        processing_time = Accelerator._time_conversion(
             transpiled_circuit.duration, transpiled_circuit.unit, dt=be.dt
         )
+        if key is not None:
+            # Least recently used times are dropped first
+            self._processing_times[key] = processing_time
+            while len(self._processing_times) > _PROCESSING_TIMES_SIZE:
+                self._processing_times.popitem(last=False)
+        return processing_time
 
     def compute_setup_time(
         self, circuit_from: QuantumCircuit | None, circuit_to: QuantumCircuit | None
@@ -155,3 +239,20 @@ class Accelerator:
         # TODO For some reason the above line blocks
         result = self.simulator.run(circuit, shots=n_shots).result()
         return result.get_counts(0)
+
+    def run_and_get_counts_batch(
+        self, circuits: list[QuantumCircuit], n_shots: int = 2**10
+    ) -> list[dict[str, int]]:
+        """Run multiple circuits in a single simulator call and get their counts.
+
+        Args:
+            circuits (list[QuantumCircuit]): The circuits to run.
+            n_shots (int, optional): Number of shots per circuit. Defaults to 2**10.
+
+        Returns:
+            list[dict[str, int]]: Measurment counts, preserving order.
+        """
+        if len(circuits) == 0:
+            return []
+        result = self.simulator.run(circuits, shots=n_shots).result()
+        return [result.get_counts(idx) for idx in range(len(circuits))]
@@ -1,11 +1,15 @@
 """A common interface for multiple accelerators."""
-from itertools import zip_longest
-from multiprocessing import Pool, current_process, Manager, Queue
-from qiskit import QuantumCircuit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from hashlib import blake2b
+from io import BytesIO
+from qiskit import QuantumCircuit, qpy
 
 from src.common import CombinedJob, Experiment, ScheduledJob
 from .accelerator import Accelerator
 
+# The accelerators of the current worker process, set by _init_worker
+_ACCELERATORS: list[Accelerator] = []
+
 
 class AcceleratorGroup:
     """
@@ -15,6 +19,42 @@ class AcceleratorGroup:
     def __init__(self, accelerators: list[Accelerator]) -> None:
         self._accelerators = accelerators
         self._qpu_qubits = [acc.qubits for acc in accelerators]
+        self._qubits = sum(self._qpu_qubits)
+        # Worker pool, created on first use and kept until close()
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "AcceleratorGroup":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if getattr(self, "_pool", None) is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        """Shuts down the worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Returns the persistent worker pool, starting it if necessary.
+
+        Each worker receives the accelerators once on start up.
+        Unlike multiprocessing.Pool, the executor raises BrokenProcessPool
+        instead of blocking forever if a worker dies.
+        Returns:
+            ProcessPoolExecutor: The worker pool.
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=len(self._accelerators),
+                initializer=_init_worker,
+                initargs=(self._accelerators,),
+            )
+        return self._pool
 
     @property
     def qpus(self) -> list[int]:
@@ -41,7 +81,7 @@ class AcceleratorGroup:
         Returns:
             int: The total number of qubits.
         """
-        return sum(self._qpu_qubits)
+        return self._qubits
 
     def run_and_get_counts(
         self, circuits: list[QuantumCircuit]
@@ -55,44 +95,48 @@ class AcceleratorGroup:
         Returns:
             list[dict[int, int]]: A list of result counts, preserving order.
         """
-        counts = []
-        for circuit, accelerator in zip(circuits, self._accelerators):
-            # TODO in parallel!
-            counts.append(accelerator.run_and_get_counts(circuit))
+        pairs = list(zip(circuits, self._accelerators))
+        if len(pairs) == 0:
+            return []
+        # Accelerators of the same backend share one simulator instance,
+        # so each thread runs all circuits of one simulator in turn.
+        # The simulators release the GIL, so threads overlap the runs.
+        per_simulator: dict[int, list[int]] = {}
+        for idx, (_, accelerator) in enumerate(pairs):
+            per_simulator.setdefault(id(accelerator.simulator), []).append(idx)
+        counts: list[dict[int, int]] = [{} for _ in pairs]
+
+        def run_simulator(indices: list[int]) -> None:
+            for idx in indices:
+                circuit, accelerator = pairs[idx]
+                counts[idx] = accelerator.run_and_get_counts(circuit)
+
+        with ThreadPoolExecutor(max_workers=len(per_simulator)) as executor:
+            # Consume the results to surface exceptions from the runs
+            list(executor.map(run_simulator, per_simulator.values()))
         # TODO do some magic to figure out which counts belong to which circuit
         return counts
 
     def run_jobs(self, jobs: list[ScheduledJob]) -> list[CombinedJob]:
         """Runs a list of scheduled jobs on their respective accelerators.
 
-        Creates a tuple of jobs to run at the same time onf different qpus.
+        All jobs are submitted to the worker pool at once.
         Jobs are run in parallel.
         Args:
             jobs (list[ScheduledJob]): The jobs to run.
 
         Returns:
-            list[ScheduledJob]: The jobs with results inserted.
+            list[CombinedJob]: The jobs with results inserted, preserving order.
         """
-        jobs_per_qpu = {
-            qpu: [job for job in jobs if job.qpu == qpu]
-            for qpu, _ in enumerate(self.accelerators)
-        }  # Sort by qpu
-        manager = Manager()
-        idx_queue = manager.Queue()
-        for idx in range(len(self._accelerators)):
-            idx_queue.put(idx)
-        with Pool(
-            processes=len(self._accelerators),
-            initializer=_init_accs,
-            initargs=(idx_queue,),
-        ) as pool:
-            results = []
-            for job in zip_longest(*jobs_per_qpu.values()):  # Run jobs in parallel
-                result = pool.apply_async(_run_job, [self._accelerators, job])
-                results.append(result)
-            results = [result.get() for result in results]
-        results = [result for result in results if result is not None]
-        return results
+        if len(jobs) == 0:
+            return []
+        chunksize = max(1, len(jobs) // (4 * len(self._accelerators)))
+        # Workers only send back the counts, not the whole job with its circuit
+        counts = self._get_pool().map(_run_job, jobs, chunksize=chunksize)
+        for job, job_counts in zip(jobs, counts):
+            if job_counts is not None:
+                job.job.result_counts = job_counts
+        return [job.job for job in jobs]
 
     def run_experiments(self, experiments: list[Experiment]) -> list[Experiment]:
         """Runs all circuits belonging to a list of experiments.
@@ -106,72 +150,104 @@ class AcceleratorGroup:
         Returns:
            list[Experiment]: Experiment with results inserted.
         """
-        manager = Manager()
-        idx_queue = manager.Queue()
-        for idx in range(len(self._accelerators)):
-            idx_queue.put(idx)
-        with Pool(
-            processes=len(self._accelerators),
-            initializer=_init_accs,
-            initargs=(idx_queue,),
-        ) as pool:
-            results = []
-            for experiment in experiments:
-                result = pool.apply_async(_run_func, [self._accelerators, experiment])
-                results.append(result)
-            results = [result.get() for result in results]
-
-        return results
-
-
-def _init_accs(queue: Queue) -> None:
-    idx = queue.get()
-    current_process().name = str(idx)
-
-
-def _run_func(accs: list[Accelerator], exp: Experiment) -> Experiment:
+        if len(experiments) == 0:
+            return experiments
+        chunksize = max(1, len(experiments) // (4 * len(self._accelerators)))
+        # Experiments are spread round robin over the accelerators.
+        # Results are slotted back by index.
+        for idx, counts in self._get_pool().map(
+            _run_func, _intern_circuits(experiments), chunksize=chunksize
+        ):
+            if counts is not None:
+                experiments[idx].result_counts = counts
+
+        return experiments
+
+
+def _intern_circuits(
+    experiments: list[Experiment],
+) -> list[tuple[int, list[QuantumCircuit] | None, list[int] | None]]:
+    """Builds the pool tasks for a list of experiments.
+
+    Identical circuits are only sent once per task.
+    Circuits are identified by the digest of their QPY serialization.
+    Args:
+        experiments (list[Experiment]): The experiments to run.
+
+    Returns:
+        list[tuple[int, list[QuantumCircuit] | None, list[int] | None]]:
+            The index of each experiment, its distinct circuits and the position
+            of every original circuit in the distinct circuits.
+    """
+    interned: dict[bytes, QuantumCircuit] = {}
+    tasks = []
+    for idx, exp in enumerate(experiments):
+        if exp.circuits is None:
+            tasks.append((idx, None, None))
+            continue
+        positions: dict[bytes, int] = {}
+        circuits = []
+        mapping = []
+        for circuit in exp.circuits:
+            buffer = BytesIO()
+            qpy.dump(circuit, buffer)
+            digest = blake2b(buffer.getvalue()).digest()
+            if digest not in positions:
+                positions[digest] = len(circuits)
+                # Sharing the object lets pickle send it once per chunk
+                circuits.append(interned.setdefault(digest, circuit))
+            mapping.append(positions[digest])
+        tasks.append((idx, circuits, mapping))
+    return tasks
+
+
+def _run_func(
+    task: tuple[int, list[QuantumCircuit] | None, list[int] | None]
+) -> tuple[int, list[dict[str, int]] | None]:
     """Wrapper to run Experiment on a single accelerator.
 
     Args:
-        accs (list[Accelerator]): The internal accelerators.
-        exp (Experiment): The experiment to run on this accelerator.
+        task (tuple[int, list[QuantumCircuit] | None, list[int] | None]):
+            The index of the experiment, its distinct circuits and the mapping
+            back to the original circuits from `_intern_circuits`.
 
     Returns:
-        Experiment: Experiment with results inserted.
+        tuple[int, list[dict[str, int]] | None]: The index of the experiment and
+            the counts per circuit or None if running failed.
 
     """
-    pool_id = int(current_process().name)
+    idx, circuits, mapping = task
+    accelerator = _ACCELERATORS[idx % len(_ACCELERATORS)]
     try:
-        exp.result_counts = [
-            accs[pool_id].run_and_get_counts(circ) for circ in exp.circuits
-        ]
+        # Every circuit is still run on its own, duplicates included
+        return idx, accelerator.run_and_get_counts_batch(
+            [circuits[position] for position in mapping]
+        )
     except Exception as exc:
-        # To make result.get() work deterministically
+        # Report the failure and keep collecting the other experiments
         print(exc)
-    return exp
+    return idx, None
+
+
+def _init_worker(accelerators: list[Accelerator]) -> None:
+    global _ACCELERATORS
+    _ACCELERATORS = accelerators
 
 
-def _run_job(
-    accs: list[Accelerator], jobs: tuple[ScheduledJob | None]
-) -> CombinedJob | None:
-    """Selects a job from a tuple of jobs and runs it on the respective accelerator.
+def _run_job(job: ScheduledJob) -> dict[str, int] | None:
+    """Runs a job on the accelerator it was scheduled on.
 
     Args:
-        accs (list[Accelerator]): the internal accelerators.
-        jobs (tuple[ScheduledJob  |  None]): The jobs which are run in parallel.
+        job (ScheduledJob): The job to run.
 
     Returns:
-        CombinedJob | None: Returns the job with results inserted or None if no job was submited.
+        dict[str, int] | None: The counts of the job or None if running failed.
     """
-    pool_id = int(current_process().name)
-    if pool_id > len(accs):
-        return None
-    job = jobs[pool_id]
-    if job is None:
-        return None
     run_job = job.job
     try:
-        run_job.result_counts = accs[pool_id].run_and_get_counts(run_job.circuit, run_job.n_shots)
+        return _ACCELERATORS[job.qpu].run_and_get_counts(
+            run_job.circuit, run_job.n_shots
+        )
     except Exception as exc:
         print(exc)
-    return run_job
+    return None
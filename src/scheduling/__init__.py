@@ -2,4 +2,5 @@
 from .types import *
 
 from .generate_schedule import generate_schedule
+from .setup_lp import set_up_base_lp
 from .scheduler import Scheduler
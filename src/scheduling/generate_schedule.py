@@ -1,5 +1,5 @@
 """Wrapper for schedule generation."""
-from uuid import uuid4
+import numpy as np
 
 from src.common import CircuitJob, ScheduledJob
 from src.provider import Accelerator
@@ -19,13 +19,13 @@ from .types import (
     LPInstance,
     PTimes,
     SchedulerType,
-    STimes,
 )
 
 
 def generate_schedule(
     problem: InfoProblem | ExecutableProblem,
     schedule_type: SchedulerType,
+    base_lp: LPInstance | None = None,
 ) -> tuple[float, list[JobResultInfo], LPInstance | None] | list[ScheduledJob]:
     """Generates the schedule for the given problem and schedule type.
 
@@ -35,6 +35,9 @@ def generate_schedule(
     Args:
         problem (InfoProblem | ExecutableProblem ): The full problem definition.
         schedule_type (SchedulerType): The type of schedule to use.
+        base_lp (LPInstance | None, optional): A base LP for the problem from
+            `set_up_base_lp`, which is copied instead of setting up a new one.
+            Defaults to None.
 
     Returns:
         list[ScheduledJob]: List of ScheduledJobs. |
@@ -45,15 +48,16 @@ def generate_schedule(
         NotImplementedError: Unsupported types.
     """
     if isinstance(problem, InfoProblem):
-        return _generate_schedule_info(problem, schedule_type)
+        return _generate_schedule_info(problem, schedule_type, base_lp)
     if isinstance(problem, ExecutableProblem):
-        return _generate_schedule_exec(problem, schedule_type)
+        return _generate_schedule_exec(problem, schedule_type, base_lp)
     raise NotImplementedError("Unsupported type")
 
 
 def _generate_schedule_info(
     problem: InfoProblem,
     schedule_type: SchedulerType,
+    base_lp: LPInstance | None = None,
 ) -> tuple[float, list[JobResultInfo], LPInstance | None]:
     """Generates the schedule for the given problem and schedule type.
 
@@ -61,6 +65,7 @@ def _generate_schedule_info(
     Args:
         problem (InfoProblem): The full problem definition.
         schedule_type (SchedulerType): The type of schedule to use.
+        base_lp (LPInstance | None, optional): Base LP to copy. Defaults to None.
 
     Returns:
         tuple[float, list[JobResultInfo]]: The makespan and the list of jobs with their
@@ -73,14 +78,7 @@ def _generate_schedule_info(
         )
         return makespan, jobs, None
 
-    lp_instance = set_up_base_lp(
-        problem.base_jobs, problem.accelerators, problem.big_m, problem.timesteps
-    )
-    # show jobs 
-    print("Jobs:")
-    for job in problem.base_jobs:
-        print(job.num_qubits)
-    
+    lp_instance = _get_base_lp(problem, base_lp)
     if schedule_type == SchedulerType.EXTENDED:
         lp_instance = set_up_extended_lp(
             lp_instance=lp_instance,
@@ -106,6 +104,7 @@ def _generate_schedule_info(
 def _generate_schedule_exec(
     problem: ExecutableProblem,
     schedule_type: SchedulerType,
+    base_lp: LPInstance | None = None,
 ) -> list[ScheduledJob]:
     """Generates the schedule for the given problem and schedule type.
 
@@ -114,6 +113,7 @@ def _generate_schedule_exec(
     Args:
         problem (ExecutableProblem): The full problem definition.
         schedule_type (SchedulerType): The type of schedule to use.
+        base_lp (LPInstance | None, optional): Base LP to copy. Defaults to None.
 
     Returns:
         list[ScheduledJob]: List of ScheduledJobs.
@@ -121,9 +121,7 @@ def _generate_schedule_exec(
     if schedule_type == SchedulerType.BASELINE:
         return generate_bin_executable_schedule(problem.base_jobs, problem.accelerators)
 
-    lp_instance = set_up_base_lp(
-        problem.base_jobs, problem.accelerators, problem.big_m, problem.timesteps
-    )
+    lp_instance = _get_base_lp(problem, base_lp)
     process_times = _get_processing_times(problem.base_jobs, problem.accelerators)
     setup_times = _get_setup_times(problem.base_jobs, problem.accelerators)
     if schedule_type == SchedulerType.EXTENDED:
@@ -145,32 +143,36 @@ def _generate_schedule_exec(
     )
 
 
+def _get_base_lp(
+    problem: InfoProblem | ExecutableProblem, base_lp: LPInstance | None
+) -> LPInstance:
+    if base_lp is not None:
+        return base_lp.copy()
+    return set_up_base_lp(
+        problem.base_jobs, problem.accelerators, problem.big_m, problem.timesteps
+    )
+
+
 def _get_setup_times(
     base_jobs: list[CircuitJob], accelerators: list[Accelerator]
-) -> STimes:
-    job_0 = CircuitJob(
-        coefficient=None,
-        cregs=0,
-        index=0,
-        circuit=None,
-        n_shots=0,
-        observable="",
-        partition_label="",
-        result_counts=None,
-        uuid=uuid4(),
-    )
-    return [
+) -> np.ndarray:
+    # Index 0 is the dummy start job without a circuit
+    circuits = [None] + [job.circuit for job in base_jobs]
+    return np.array(
         [
             [
-                50.0
-                if job_i.circuit is None or job_j.circuit is None
-                else qpu.compute_setup_time(job_i.circuit, job_j.circuit)
-                for qpu in accelerators
+                [
+                    50.0
+                    if circuit_i is None or circuit_j is None
+                    else qpu.compute_setup_time(circuit_i, circuit_j)
+                    for qpu in accelerators
+                ]
+                for circuit_i in circuits
             ]
-            for job_i in [job_0] + base_jobs
-        ]
-        for job_j in [job_0] + base_jobs
-    ]
+            for circuit_j in circuits
+        ],
+        dtype=np.float64,
+    ).reshape(len(circuits), len(circuits), len(accelerators))
 
 
 def _get_processing_times(
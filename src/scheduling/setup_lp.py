@@ -1,4 +1,6 @@
 """Module for setting up the base LP instance."""
+from functools import lru_cache
+
 from qiskit import QuantumCircuit
 import numpy as np
 import pulp
@@ -125,11 +127,34 @@ def _define_lp(
     big_m: int,
 ) -> LPInstance:
     jobs = list(job_capacities.keys())
-    print("Jobs in define_lp:")
-    print(jobs)
     machines = list(machine_capacities.keys())
+    job_caps = np.array(list(job_capacities.values()), dtype=np.int64)
+    machine_caps = np.array(list(machine_capacities.values()), dtype=np.int64)
+    # fits[j, m] is True if job j is small enough for machine m
+    fits = job_caps[:, np.newaxis] <= machine_caps[np.newaxis, :]
     x_ik = pulp.LpVariable.dicts("x_ik", (jobs, machines), cat="Binary")                # Binary variable indicating whether job job is assigned to machine
-    z_ikt = pulp.LpVariable.dicts("z_ikt", (jobs, machines, timesteps), cat="Binary")   # Binary variable indicating whether job job is assigned to machine at timestep t
+    # Machines each job fits on
+    fitting_machines = {
+        job: [machines[m_idx] for m_idx in np.flatnonzero(fits[j_idx])]
+        for j_idx, job in enumerate(jobs[1:], start=1)
+    }
+    # Binary variable indicating whether job job is assigned to machine at timestep t
+    # Only materialized for the machines the job fits on, the others are always 0
+    # Keyed by (job, machine, timestep) so each access is a single dict lookup
+    z_ikt = {
+        (job, machine, timestep): pulp.LpVariable(
+            f"z_ikt_{job}_{machine}_{timestep}", cat="Binary"
+        )
+        for job, job_machines in fitting_machines.items()
+        for machine in job_machines
+        for timestep in timesteps
+    }
+    # (job, capacity) of all jobs fitting each machine, machines without any are left out
+    fitting_jobs: dict[str, list[tuple[str, int]]] = {}
+    for m_idx, machine in enumerate(machines):
+        j_indices = np.flatnonzero(fits[1:, m_idx]) + 1
+        if len(j_indices) > 0:
+            fitting_jobs[machine] = [(jobs[j], int(job_caps[j])) for j in j_indices]
 
     c_j = pulp.LpVariable.dicts("c_j", (jobs), 0, cat="Continuous")                     # Completion time of job
     s_j = pulp.LpVariable.dicts("s_j", (jobs), 0, cat="Continuous")                     # Start time of job
@@ -141,39 +166,56 @@ def _define_lp(
     problem += c_j["0"] == 0                                                            # (C2)
     for job in jobs[1:]:
         problem += c_j[job] <= c_max                                                    # (C1)
-        problem += pulp.lpSum(x_ik[job][machine] for machine in machines) == 1          # (C3)
-        
-        problem += c_j[job] - s_j[job] + 1 == pulp.lpSum(                               # (C7)
-            z_ikt[job][machine][timestep]
-            for timestep in timesteps
-            for machine in machines
+        problem += (
+            pulp.LpAffineExpression([(x_ik[job][machine], 1) for machine in machines])
+            == 1                                                                        # (C3)
         )
-        for machine in machines:
-            problem += (                                                                 # (C8)
-                pulp.lpSum(z_ikt[job][machine][timestep] for timestep in timesteps)
-                <= x_ik[job][machine] * big_m
+        
+        job_machines = fitting_machines[job]
+        # Build the sums over timesteps (per machine) once
+        # directly from (variable, coefficient) pairs instead of going through lpSum
+        z_by_machine = {
+            machine: pulp.LpAffineExpression(
+                [(z_ikt[job, machine, timestep], 1) for timestep in timesteps]
             )
+            for machine in job_machines
+        }
+        problem += c_j[job] - s_j[job] + 1 == pulp.LpAffineExpression(                  # (C7)
+            [
+                (z_ikt[job, machine, timestep], 1)
+                for machine in job_machines
+                for timestep in timesteps
+            ]
+        )
+        for machine, z_sum in z_by_machine.items():
+            problem += z_sum <= x_ik[job][machine] * big_m                              # (C8)
 
+        # The per timestep constraints are built from their coefficients directly,
+        # moving everything to the left hand side, instead of expression arithmetic
+        c_term = (c_j[job], -1)
+        s_term = (s_j[job], 1)
         for timestep in timesteps:
-            problem += (                                                                # (C9)
-                pulp.lpSum(z_ikt[job][machine][timestep] for machine in machines)
-                * timestep
-                <= c_j[job]
+            z_vars = [z_ikt[job, machine, timestep] for machine in job_machines]
+            problem += pulp.LpConstraint(                                               # (C9)
+                [(z_var, timestep) for z_var in z_vars if timestep != 0] + [c_term],
+                pulp.LpConstraintLE,
             )
-            problem += (
-                pulp.lpSum(z_ikt[job][machine][timestep] for machine in machines) <= 1  # (C4)
+            problem += pulp.LpConstraint(                                               # (C4)
+                [(z_var, 1) for z_var in z_vars], pulp.LpConstraintLE, rhs=1
             )
-            problem += s_j[job] <= pulp.lpSum(                                          # (C10)
-                z_ikt[job][machine][timestep] for machine in machines
-            ) * timestep + big_m * (
-                1 - pulp.lpSum(z_ikt[job][machine][timestep] for machine in machines)
+            problem += pulp.LpConstraint(                                               # (C10)
+                [s_term] + [(z_var, big_m - timestep) for z_var in z_vars],
+                pulp.LpConstraintLE,
+                rhs=big_m,
             )
     for timestep in timesteps:
-        for machine in machines:
+        for machine, machine_jobs in fitting_jobs.items():
             problem += (                                                                # (C11)
-                pulp.lpSum(
-                    z_ikt[job][machine][timestep] * job_capacities[job]
-                    for job in jobs[1:]
+                pulp.LpAffineExpression(
+                    [
+                        (z_ikt[job, machine, timestep], capacity)
+                        for job, capacity in machine_jobs
+                    ]
                 )
                 <= machine_capacities[machine]
             )
@@ -206,46 +248,77 @@ def set_up_simple_lp(
     Returns:
         LPInstance: The updated LP instance.
     """
-    p_times = pulp.makeDict(
-        [lp_instance.jobs[1:], lp_instance.machines],
-        process_times,
-        0,
+    p_times = _make_times_dict(
+        [lp_instance.jobs[1:], lp_instance.machines], process_times
     )
-    s_times = pulp.makeDict(
+    s_times = _make_times_dict(
         [lp_instance.jobs[1:], lp_instance.machines],
         _get_simple_setup_times(setup_times),
-        0,
     )
 
+    problem = lp_instance.problem
+    machines = lp_instance.machines
     for job in lp_instance.jobs[1:]:
-        lp_instance.problem += lp_instance.c_j[job] >= lp_instance.s_j[                     #(C5)
-            job
-        ] + pulp.lpSum(
-            lp_instance.x_ik[job][machine]
-            * (p_times[job][machine] + s_times[job][machine])
-            for machine in lp_instance.machines
+        # c_j - s_j - sum_k x_ik * (p_ik + s_ik) >= 0, zero terms are left out
+        # like multiplying by 0 did before
+        job_times = {
+            machine: p_times[job][machine] + s_times[job][machine]
+            for machine in machines
+        }
+        problem += pulp.LpConstraint(                                                   #(C5)
+            [(lp_instance.c_j[job], 1), (lp_instance.s_j[job], -1)]
+            + [
+                (lp_instance.x_ik[job][machine], -time)
+                for machine, time in job_times.items()
+                if time != 0
+            ],
+            pulp.LpConstraintGE,
         )
     return lp_instance
 
 
+def _make_times_dict(
+    headers: list[list[str]], times: PTimes | STimes
+) -> dict:
+    """`pulp.makeDict` with default 0, cached on the headers and the time values.
+
+    The simple and extended LP of a problem are set up from the same times.
+    The returned dicts are shared between calls and must not be modified.
+    """
+    array = np.ascontiguousarray(times)
+    return _make_dict_cached(
+        tuple(tuple(header) for header in headers),
+        array.tobytes(),
+        array.dtype.str,
+        array.shape,
+    )
+
+
+@lru_cache(maxsize=32)
+def _make_dict_cached(
+    headers: tuple[tuple[str, ...], ...],
+    data: bytes,
+    dtype: str,
+    shape: tuple[int, ...],
+) -> dict:
+    times = np.frombuffer(data, dtype=dtype).reshape(shape).tolist()
+    return pulp.makeDict([list(header) for header in headers], times, 0)
+
+
 def _get_simple_setup_times(
     setup_times: STimes,
 ) -> list[list[float]]:
     """Overestimates the actual setup times for the simple LP."""
-    new_times = [
-        list(
-            np.max(
-                times[[t not in [0, idx] for t, _ in enumerate(times)]].transpose(),
-                axis=1,
-            )
-        )
-        for idx, times in enumerate(np.array(setup_times))
-    ]
-    # remove job 0
-    del new_times[0]
-    for times in new_times:
-        del times[0]
-    return new_times
+    times = np.asarray(setup_times, dtype=np.float64)
+    # Only consider real predecessors: exclude job 0 and the job itself
+    mask = np.ones(times.shape[:2], dtype=bool)
+    mask[:, 0] = False
+    np.fill_diagonal(mask, False)
+    # A masked reduction streams over the times once, without a masked copy.
+    # Jobs without a real predecessor (a single job) get no setup cost
+    new_times = times.max(axis=1, where=mask[:, :, np.newaxis], initial=0.0)
+    # remove job 0, the first column is dropped like in the previous list version
+    return new_times[1:, 1:].tolist()
 
 
 def set_up_extended_lp(
@@ -267,153 +340,162 @@ def set_up_extended_lp(
     Returns:
         LPInstance: The updated LP instance.
     """
-    # List of jobs
-    # Compare lenght job with machines
-    # Print the jobs
-    print("Jobs in set_up_extended_lp:")
-    for job in lp_instance.jobs:
-        print(job)
-    # Print the machines
-    print("Machines in set_up_extended_lp:")
-    for machine in lp_instance.machines:
-        print(machine)
-    # Print the process times
-    print("Process times:")
-    print(process_times)
-    p_times = pulp.makeDict(
-        [lp_instance.jobs[1:], lp_instance.machines],
-        process_times,
-        0,
-    )
-    # Print the process times
-    print("Process times:")
-    print(p_times)
-    s_times = pulp.makeDict(
-        [lp_instance.jobs, lp_instance.jobs, lp_instance.machines],
-        setup_times,
-        0,
-    )
-    # Print the setup times
-    for job_i in lp_instance.jobs:
-        for job_j in lp_instance.jobs:
-            for machine in lp_instance.machines:
-                print(f"Setup time for job {job_i} on job {job_j} on machine {machine}: {s_times[job_i][job_j][machine]}")
+    # Bind the instance attributes once, they are used in the nested loops below
+    problem = lp_instance.problem
+    jobs = lp_instance.jobs
+    real_jobs = jobs[1:]
+    machines = lp_instance.machines
+    x_ik = lp_instance.x_ik
+    z_ikt = lp_instance.z_ikt
+    c_j = lp_instance.c_j
+    s_j = lp_instance.s_j
+
+    p_times = _make_times_dict([real_jobs, machines], process_times)
+    s_times = _make_times_dict([jobs, jobs, machines], setup_times)
     # decision variables
     y_ijk = pulp.LpVariable.dicts(
         "y_ijk",
-        (lp_instance.jobs, lp_instance.jobs, lp_instance.machines),
+        (jobs, jobs, machines),
         cat="Binary",
     )
     a_ij = pulp.LpVariable.dicts(
-        "a_ij", (lp_instance.jobs, lp_instance.jobs), cat="Binary"
+        "a_ij", (jobs, jobs), cat="Binary"
     )  # a: Job i ends before job j starts
     b_ij = pulp.LpVariable.dicts(
-        "b_ij", (lp_instance.jobs, lp_instance.jobs), cat="Binary"
+        "b_ij", (jobs, jobs), cat="Binary"
     )  # b: Job i ends before job j ends
     d_ijk = pulp.LpVariable.dicts(
         "d_ijk",
-        (lp_instance.jobs, lp_instance.jobs, lp_instance.machines),
+        (jobs, jobs, machines),
         cat="Binary",
     )  # d: Job i and  j run on the same machine
-    e_ijlk = pulp.LpVariable.dicts(
-        "e_ijlk",
-        (lp_instance.jobs, lp_instance.jobs, lp_instance.jobs, lp_instance.machines),
-        cat="Binary",
-    )
-
-    for job in lp_instance.jobs[1:]:
-        lp_instance.problem += (                                                        # 
-            pulp.lpSum(                                 # (Constraint 12)
-                y_ijk[job_j][job][machine]
-                for machine in lp_instance.machines
-                for job_j in lp_instance.jobs
+    # e: Job l runs between jobs i and j on the same machine
+    # Only created for distinct jobs which all fit on the machine, see Constraint 19
+    e_ijlk: dict[tuple[str, str, str], list[pulp.LpVariable]] = {}
+
+    for job in real_jobs:
+        # The predecessor variables y_jik of the job are used by constraints
+        # 12, 5, 13 and 6, they are looked up once per machine
+        pred_y = {
+            machine: [y_ijk[job_j][job][machine] for job_j in jobs]
+            for machine in machines
+        }
+        problem += (                                                                    #
+            pulp.LpAffineExpression(                    # (Constraint 12)
+                [(y_var, 1) for machine in machines for y_var in pred_y[machine]]
             )
             >= 1  # each job has a predecessor
         )
-        lp_instance.problem += lp_instance.c_j[job] >= lp_instance.s_j[  # (Constrait 5)
-            job
-        ] + pulp.lpSum(
-            lp_instance.x_ik[job][machine] * p_times[job][machine]
-            for machine in lp_instance.machines
-        ) + pulp.lpSum(
-            y_ijk[job_j][job][machine] * s_times[job_j][job][machine]
-            for machine in lp_instance.machines
-            for job_j in lp_instance.jobs
+        problem += c_j[job] >= s_j[job] + pulp.LpAffineExpression(      # (Constrait 5)
+            [
+                (x_ik[job][machine], p_times[job][machine])
+                for machine in machines
+                if p_times[job][machine] != 0
+            ]
+            + [
+                (y_var, s_times[job_j][job][machine])
+                for machine in machines
+                for job_j, y_var in zip(jobs, pred_y[machine])
+                if s_times[job_j][job][machine] != 0
+            ]
         )
-        for machine in lp_instance.machines:
-            lp_instance.problem += (  # prec                         # (Constraint 13)
-                lp_instance.x_ik[job][machine]
-                >= pulp.lpSum(y_ijk[job_j][job][machine] for job_j in lp_instance.jobs)
+        for machine in machines:
+            problem += (  # prec                                         # (Constraint 13)
+                x_ik[job][machine]
+                >= pulp.LpAffineExpression([(y_var, 1) for y_var in pred_y[machine]])
                 / big_m
             )
-            lp_instance.problem += (  # Sucesssor                         # (Constraint 14)
-                lp_instance.x_ik[job][machine]
-                >= pulp.lpSum(y_ijk[job][job_j][machine] for job_j in lp_instance.jobs)
+            problem += (  # Sucesssor                                    # (Constraint 14)
+                x_ik[job][machine]
+                >= pulp.LpAffineExpression(
+                    [(y_ijk[job][job_j][machine], 1) for job_j in jobs]
+                )
                 / big_m
             )
-            lp_instance.problem += (                                                                # (Constraint 15)
-                lp_instance.z_ikt[job][machine][0] == y_ijk["0"][job][machine]
-            )
-                                                                 
-        for job_j in lp_instance.jobs:
-            lp_instance.problem += (                                                            # (Constraint 6)
-                lp_instance.c_j[job_j]
+            if (job, machine, 0) in z_ikt:
+                problem += z_ikt[job, machine, 0] == y_ijk["0"][job][machine]   # (Constraint 15)
+            else:  # The job does not fit on the machine, z_ikt is implicitly 0
+                problem += y_ijk["0"][job][machine] == 0
+
+        for j_idx, job_j in enumerate(jobs):
+            problem += (                                                # (Constraint 6)
+                c_j[job_j]
                 + (
-                    pulp.lpSum(
-                        y_ijk[job_j][job][machine] for machine in lp_instance.machines
+                    pulp.LpAffineExpression(
+                        [(pred_y[machine][j_idx], 1) for machine in machines]
                     )
                     - 1
                 )
                 * big_m
-                <= lp_instance.s_j[job]
+                <= s_j[job]
             )
 
     # Extended constraints
-    for job in lp_instance.jobs[1:]:
-        for job_j in lp_instance.jobs[1:]:
+    # They are collected and added in one go, extend names them like += does
+    constraints: list[pulp.LpConstraint] = []
+    add = constraints.append
+    # The nested dicts are resolved once per job (pair) instead of once per machine
+    for job in real_jobs:
+        x_i = x_ik[job]
+        a_i, b_i, d_i = a_ij[job], b_ij[job], d_ijk[job]
+        for job_j in real_jobs:
             if job == job_j:
-                lp_instance.problem += a_ij[job][job_j] == 0
-                lp_instance.problem += b_ij[job][job_j] == 0
+                add(a_i[job_j] == 0)
+                add(b_i[job_j] == 0)
                 continue
-            lp_instance.problem += (
-                a_ij[job][job_j]
-                >= (lp_instance.s_j[job_j] - lp_instance.c_j[job]) / big_m          # (Constraint 16)
-            )
-            lp_instance.problem += (
-                b_ij[job][job_j]
-                >= (lp_instance.c_j[job_j] - lp_instance.c_j[job]) / big_m          # (Constraint 17)
-            )
-            for machine in lp_instance.machines:
-                lp_instance.problem += (                                # (Constraint 18)
-                    d_ijk[job][job_j][machine]
-                    >= lp_instance.x_ik[job][machine]
-                    + lp_instance.x_ik[job_j][machine]
-                    - 1
-                )
-                for job_l in lp_instance.jobs[1:]:                      # (Constraint 19)
-                    lp_instance.problem += (
-                        e_ijlk[job][job_j][job_l][machine]
-                        >= b_ij[job][job_l]
-                        + a_ij[job_l][job_j]
-                        + d_ijk[job][job_j][machine]
-                        + d_ijk[job][job_l][machine]
-                        - 3
+            add(a_i[job_j] >= (s_j[job_j] - c_j[job]) / big_m)         # (Constraint 16)
+            add(b_i[job_j] >= (c_j[job_j] - c_j[job]) / big_m)         # (Constraint 17)
+            x_j, d_ij = x_ik[job_j], d_i[job_j]
+            for machine in machines:
+                add(d_ij[machine] >= x_i[machine] + x_j[machine] - 1)  # (Constraint 18)
+                # e can only be forced to 1 if all three jobs can run on the machine
+                # and l differs from i and j (b_ii = a_jj = 0), otherwise it is left out
+                if (job, machine, 0) not in z_ikt or (job_j, machine, 0) not in z_ikt:
+                    continue
+                e_ijl = e_ijlk.setdefault((job, job_j, machine), [])
+                # Terms shared by all l, the constraint is built from its coefficients
+                # e - b_il - a_lj - d_ijk - d_ilk >= -3 without expression arithmetic
+                d_term = (d_ij[machine], -1)
+                for job_l in real_jobs:                                 # (Constraint 19)
+                    if job_l in (job, job_j) or (job_l, machine, 0) not in z_ikt:
+                        continue
+                    e_var = pulp.LpVariable(
+                        f"e_ijlk_{job}_{job_j}_{job_l}_{machine}", cat="Binary"
+                    )
+                    e_ijl.append(e_var)
+                    add(
+                        pulp.LpConstraint(
+                            [
+                                (e_var, 1),
+                                (b_i[job_l], -1),
+                                (a_ij[job_l][job_j], -1),
+                                d_term,
+                                (d_i[job_l][machine], -1),
+                            ],
+                            pulp.LpConstraintGE,
+                            rhs=-3,
+                        )
                     )
 
-    for job in lp_instance.jobs[1:]:
-        for job_j in lp_instance.jobs[1:]:
-            for machine in lp_instance.machines:
-                lp_instance.problem += (                            # (Constraint 20)
-                    y_ijk[job][job_j][machine]
-                    >= a_ij[job][job_j]
+    for job in real_jobs:
+        y_i, a_i, d_i = y_ijk[job], a_ij[job], d_ijk[job]
+        for job_j in real_jobs:
+            y_ij, a_ij_var, d_ij = y_i[job_j], a_i[job_j], d_i[job_j]
+            for machine in machines:
+                add(                                                    # (Constraint 20)
+                    y_ij[machine]
+                    >= a_ij_var
                     + (
-                        pulp.lpSum(
-                            e_ijlk[job][job_j][job_l][machine]
-                            for job_l in lp_instance.jobs[1:]
+                        pulp.LpAffineExpression(
+                            [
+                                (e_var, 1)
+                                for e_var in e_ijlk.get((job, job_j, machine), [])
+                            ]
                         )
                         / big_m
                     )
-                    + d_ijk[job][job_j][machine]
+                    + d_ij[machine]
                     - 2
                 )
+    problem.extend(constraints)
     return lp_instance
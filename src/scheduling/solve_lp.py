@@ -1,23 +1,52 @@
 """Solves a LP using gurobi if available."""
+from functools import lru_cache
+import os
+
 import pulp
 
 from .types import LPInstance
 
+try:
+    from gurobipy import GRB, GurobiError
+except ImportError:  # gurobipy is optional, without it there is nothing to catch
+    GRB = None
+    GurobiError = ()
+
 
 def solve_lp(lp_instance: LPInstance) -> LPInstance:
     """Solves a LP using gurobi.
 
+    The gurobi command line is tried first, then the gurobipy API.
+    Without gurobi, HiGHS is used if installed, else a multi-threaded CBC.
+    The pip version of gurobipy ships a size-limited license, models exceeding
+    it are solved with the HiGHS or CBC fallback instead.
     Args:
         lp_instance (LPInstance): The input LP instance.
 
     Returns:
         lp_instance (LPInstance): The LP instance with the solved problem object..
     """
-    solver_list = pulp.listSolvers(onlyAvailable=True)
-    gurobi = "GUROBI_CMD"
-    if gurobi in solver_list:
-        solver = pulp.getSolver(gurobi)
-        lp_instance.problem.solve(solver)
-    else:
-        lp_instance.problem.solve()
+    try:
+        lp_instance.problem.solve(_default_solver())
+    except GurobiError as exc:
+        if exc.errno != GRB.Error.SIZE_LIMIT_EXCEEDED:
+            raise
+        lp_instance.problem.solve(_fallback_solver())
     return lp_instance
+
+
+@lru_cache(maxsize=1)
+def _default_solver() -> pulp.LpSolver:
+    # Probing the available solvers starts subprocesses, only do it once.
+    solver_list = pulp.listSolvers(onlyAvailable=True)
+    for gurobi in ("GUROBI_CMD", "GUROBI"):
+        if gurobi in solver_list:
+            return pulp.getSolver(gurobi, msg=False)
+    return _fallback_solver()
+
+
+@lru_cache(maxsize=1)
+def _fallback_solver() -> pulp.LpSolver:
+    if "HiGHS_CMD" in pulp.listSolvers(onlyAvailable=True):
+        return pulp.HiGHS_CMD(msg=False)
+    return pulp.PULP_CBC_CMD(msg=False, threads=os.cpu_count())
@@ -1,8 +1,9 @@
 """Helper Classes for Scheduling Tasks."""
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import auto, Enum
 
 from qiskit import QuantumCircuit
+import numpy as np
 import pulp
 
 from src.common import CircuitJob
@@ -28,7 +29,7 @@ class Bin:
     full: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class JobHelper:
     """Helper to keep track of job names."""
 
@@ -36,7 +37,7 @@ class JobHelper:
     circuit: QuantumCircuit | None  # TODO optional necessary?
 
 
-@dataclass
+@dataclass(slots=True)
 class LPInstance:
     """Helper to keep track of LP problem."""
 
@@ -44,11 +45,63 @@ class LPInstance:
     jobs: list[str]
     machines: list[str]
     x_ik: dict[str, dict[str, pulp.LpVariable]]
-    z_ikt: dict[str, dict[str, dict[int, pulp.LpVariable]]]
+    z_ikt: dict[tuple[str, str, int], pulp.LpVariable]  # Only fitting machines
     c_j: dict[str, pulp.LpVariable]
     s_j: dict[str, pulp.LpVariable]
     named_circuits: list[JobHelper]
 
+    def copy(self) -> "LPInstance":
+        """Copy of the instance, which can be extended and solved independently.
+
+        The copy gets fresh variables, so solving it does not overwrite the
+        `varValue`s of the original or of other copies.
+        The objective and the constraints are rebuilt on the fresh variables
+        with the same names, which is cheaper than setting up the base LP again.
+
+        Returns:
+            LPInstance: The copied LP instance.
+        """
+        variables: dict[pulp.LpVariable, pulp.LpVariable] = {}
+
+        def fresh(var: pulp.LpVariable) -> pulp.LpVariable:
+            if var not in variables:
+                variables[var] = pulp.LpVariable(
+                    var.name, var.lowBound, var.upBound, var.cat
+                )
+            return variables[var]
+
+        problem = pulp.LpProblem(self.problem.name, self.problem.sense)
+        if self.problem.objective is not None:
+            problem.objective = pulp.LpAffineExpression(
+                [
+                    (fresh(var), coeff)
+                    for var, coeff in self.problem.objective.items()
+                ],
+                constant=self.problem.objective.constant,
+                name=self.problem.objective.name,
+            )
+        problem.constraints = {
+            name: pulp.LpConstraint(
+                [(fresh(var), coeff) for var, coeff in constraint.items()],
+                constraint.sense,
+                name,
+                rhs=-constraint.constant,
+            )
+            for name, constraint in self.problem.constraints.items()
+        }
+        return replace(
+            self,
+            problem=problem,
+            x_ik={
+                job: {machine: fresh(var) for machine, var in machines.items()}
+                for job, machines in self.x_ik.items()
+            },
+            z_ikt={key: fresh(var) for key, var in self.z_ikt.items()},
+            c_j={job: fresh(var) for job, var in self.c_j.items()},
+            s_j={job: fresh(var) for job, var in self.s_j.items()},
+            named_circuits=list(self.named_circuits),
+        )
+
 
 @dataclass
 class JobResultInfo:
@@ -72,7 +125,8 @@ class Result:
 
 # Typedef
 PTimes = list[list[float]]
-STimes = list[list[list[float]]]
+# Setup times are indexed [job_j][job_i][machine], generators return (N+1, N+1, M) arrays
+STimes = list[list[list[float]]] | np.ndarray
 Benchmark = list[  # TODO should we move this?
     dict[str, dict[str, int] | list[dict[str, PTimes | STimes | dict[str, Result]]]]
 ]
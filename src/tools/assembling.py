@@ -1,6 +1,8 @@
 """Assemble a single circuit from multiple independent ones."""
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import CircuitInstruction, ControlFlowOp
 from qiskit.quantum_info import PauliList
+import numpy as np
 
 from src.common import CircuitJob, CombinedJob
 
@@ -27,18 +29,48 @@ def assemble_circuit(circuits: list[QuantumCircuit]) -> QuantumCircuit:
             )
 
     qubits, clbits = 0, 0
+    composed_qubits, composed_clbits = composed_circuit.qubits, composed_circuit.clbits
     for circuit in circuits:
-        composed_circuit.compose(
-            circuit,
-            qubits=list(range(qubits, qubits + circuit.num_qubits)),
-            clbits=list(range(clbits, clbits + circuit.num_clbits)),
-            inplace=True,
-        )
+        if _needs_compose(circuit):
+            composed_circuit.compose(
+                circuit,
+                qubits=list(range(qubits, qubits + circuit.num_qubits)),
+                clbits=list(range(clbits, clbits + circuit.num_clbits)),
+                inplace=True,
+            )
+        else:
+            # Plain instructions only need their bits replaced,
+            # the operations are copied like compose does
+            qubit_map = dict(
+                zip(circuit.qubits, composed_qubits[qubits : qubits + circuit.num_qubits])
+            )
+            clbit_map = dict(
+                zip(circuit.clbits, composed_clbits[clbits : clbits + circuit.num_clbits])
+            )
+            for instruction in circuit.data:
+                composed_circuit._append(
+                    CircuitInstruction(
+                        instruction.operation.copy(),
+                        [qubit_map[qubit] for qubit in instruction.qubits],
+                        [clbit_map[clbit] for clbit in instruction.clbits],
+                    )
+                )
+            composed_circuit.global_phase += circuit.global_phase
         qubits += circuit.num_qubits
         clbits += circuit.num_clbits
     return composed_circuit
 
 
+def _needs_compose(circuit: QuantumCircuit) -> bool:
+    """Checks if a circuit uses classical conditions, control flow or calibrations,
+    which are remapped by `QuantumCircuit.compose`."""
+    return bool(circuit.calibrations) or any(
+        getattr(instruction.operation, "condition", None) is not None
+        or isinstance(instruction.operation, ControlFlowOp)
+        for instruction in circuit.data
+    )
+
+
 def assemble_job(circuit_jobs: list[CircuitJob]) -> CombinedJob:
     """Assembles multiple circuit jobs into a single combined job.
 
@@ -53,7 +85,7 @@ def assemble_job(circuit_jobs: list[CircuitJob]) -> CombinedJob:
     combined_job = CombinedJob(n_shots=circuit_jobs[0].n_shots)
     circuits = []
     qubit_count = 0
-    observable = PauliList("")
+    observables = []
     for job in circuit_jobs:
         combined_job.indices.append(job.index)
         circuits.append(job.circuit)
@@ -62,10 +94,39 @@ def assemble_job(circuit_jobs: list[CircuitJob]) -> CombinedJob:
             slice(qubit_count, qubit_count + job.circuit.num_qubits)
         )
         qubit_count += job.circuit.num_qubits
-        observable = observable.expand(job.observable)
+        observables.append(job.observable)
         combined_job.partition_lables.append(job.partition_label)
         combined_job.uuids.append(job.uuid)
         combined_job.cregs.append(job.cregs)
     combined_job.circuit = assemble_circuit(circuits)
-    combined_job.observable = observable
+    combined_job.observable = _combine_observables(observables)
     return combined_job
+
+
+def _combine_observables(observables: list[PauliList]) -> PauliList:
+    """Tensors the observables in order, the first one acts on the lowest qubits.
+
+    Gives the same result as chaining `PauliList.expand`, but the symplectic
+    arrays are written into a preallocated buffer once instead of being copied
+    for every observable.
+    Args:
+        observables (list[PauliList]): The observables of the individual jobs.
+
+    Returns:
+        PauliList: The combined observable.
+    """
+    observables = [PauliList(observable) for observable in observables]
+    num_paulis = max(len(observable) for observable in observables)
+    num_qubits = sum(observable.num_qubits for observable in observables)
+    z = np.zeros((num_paulis, num_qubits), dtype=bool)
+    x = np.zeros((num_paulis, num_qubits), dtype=bool)
+    phase = np.zeros(num_paulis, dtype=int)
+    start = 0
+    for observable in observables:
+        # Single paulis are broadcast, like expand does
+        end = start + observable.num_qubits
+        z[:, start:end] = observable.z
+        x[:, start:end] = observable.x
+        phase += observable.phase
+        start = end
+    return PauliList.from_symplectic(z, x, np.mod(phase, 4))
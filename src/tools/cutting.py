@@ -1,4 +1,5 @@
 """Circuit cutting using the CTK library."""
+from functools import lru_cache
 from uuid import UUID, uuid4
 
 from circuit_knitting.cutting import (
@@ -11,6 +12,9 @@ import numpy as np
 
 from src.common import Experiment
 
+# Shots per experiment
+_N_SHOTS = 2**12  # TODO Calculate somehow
+
 
 def cut_circuit(
     circuit: QuantumCircuit,
@@ -30,7 +34,7 @@ def cut_circuit(
     """
     if observables is None:
         observables = PauliList("Z" * circuit.num_qubits)
-    gen_partitions = _generate_partition_labels(partitions)
+    gen_partitions = _generate_partition_labels(tuple(partitions))
     partitioned_problem = partition_problem(circuit, gen_partitions, observables)
     experiments, coefficients = generate_cutting_experiments(
         partitioned_problem.subcircuits,
@@ -42,7 +46,7 @@ def cut_circuit(
         Experiment(
             circuits,
             coefficients,  # split up by order?
-            2**12,  # TODO Calculate somehow
+            _N_SHOTS,
             partitioned_problem.subobservables[partition_label],
             partition_label,
             None,
@@ -52,6 +56,7 @@ def cut_circuit(
     ], uuid
 
 
-def _generate_partition_labels(partitions: list[int]) -> str:
+@lru_cache(maxsize=256)
+def _generate_partition_labels(partitions: tuple[int, ...]) -> str:
     # TODO find a smart way to communicate partition information
     return "".join(str(i) * value for i, value in enumerate(partitions))
@@ -1,6 +1,8 @@
 """Optimizing circuits using the Qiskit transpiler."""
+from functools import lru_cache
 
 from qiskit import QuantumCircuit
+from qiskit.transpiler import StagedPassManager
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 from src.common import IBMQBackend
@@ -23,15 +25,7 @@ def optimize_circuit_offline(
     Returns:
         QuantumCircuit: _description_
     """
-    pass_manager = generate_preset_pass_manager(
-        3, backend.value()
-    )  # TODO eventually remove dependency
-    pass_manager.layout = None
-    pass_manager.optimization = None
-    pass_manager.routing = None
-    pass_manager.scheduling = None
-    pass_manager.translation = None
-    return pass_manager.run(circuit)
+    return _offline_pass_manager(backend).run(circuit)
 
 
 def optimize_circuit_online(
@@ -49,7 +43,40 @@ def optimize_circuit_online(
     Returns:
         QuantumCircuit: _description_
     """
+    shared = _online_pass_manager(backend)
+    # Only the layout depends on the circuit, it is set on a new staged pass
+    # manager per call, the cached one is never modified.
+    _, layout = map_circuit(circuit, backend)
+    pass_manager = StagedPassManager(
+        stages=shared.stages,
+        **{
+            stage: getattr(shared, stage)
+            for stage in shared.expanded_stages
+            if stage != "layout"
+        },
+        layout=layout,
+    )
+    return pass_manager.run(circuit)
+
+
+# Building a preset pass manager takes tens of milliseconds,
+# they are built once per backend and reused, running them keeps no state.
+# Callers must not modify the returned pass managers.
+@lru_cache(maxsize=8)
+def _offline_pass_manager(backend: IBMQBackend) -> StagedPassManager:
+    pass_manager = generate_preset_pass_manager(
+        3, backend.value()
+    )  # TODO eventually remove dependency
+    pass_manager.layout = None
+    pass_manager.optimization = None
+    pass_manager.routing = None
+    pass_manager.scheduling = None
+    pass_manager.translation = None
+    return pass_manager
+
+
+@lru_cache(maxsize=8)
+def _online_pass_manager(backend: IBMQBackend) -> StagedPassManager:
     pass_manager = generate_preset_pass_manager(3, backend.value())
     pass_manager.init = None
-    _, pass_manager.layout = map_circuit(circuit, backend)
-    return pass_manager.run(circuit)
+    return pass_manager
@@ -0,0 +1,34 @@
+"""GHZ Circuit Tests."""
+from qiskit import QuantumCircuit
+
+from src.circuits import create_ghz, create_quantum_only_ghz
+
+
+def _expected_ghz(n_qubits: int, measure: bool) -> QuantumCircuit:
+    circuit = QuantumCircuit(n_qubits, n_qubits if measure else 0)
+    circuit.h(0)
+    for qubit in range(n_qubits - 1):
+        circuit.cx(qubit, qubit + 1)
+    if measure:
+        circuit.measure(range(n_qubits), range(n_qubits))
+    return circuit
+
+
+def test_create_ghz_returns_independent_circuits() -> None:
+    """_summary_"""
+    circuit = create_ghz(3)
+    assert circuit == _expected_ghz(3, measure=True)
+    circuit.x(0)
+    circuit.data.pop(1)
+    assert create_ghz(3) == _expected_ghz(3, measure=True)
+
+
+def test_create_quantum_only_ghz_returns_independent_circuits() -> None:
+    """_summary_"""
+    circuit = create_quantum_only_ghz(3)
+    assert circuit == _expected_ghz(3, measure=False)
+    circuit.x(0)
+    circuit.data.pop(1)
+    assert create_quantum_only_ghz(3) == _expected_ghz(3, measure=False)
+    # The measured variant is built from the same cached circuit
+    assert create_ghz(3) == _expected_ghz(3, measure=True)
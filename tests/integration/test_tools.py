@@ -17,12 +17,12 @@ def test_tools() -> None:
     accelerator_belem = Accelerator(backend_belem)
     backend_quito = IBMQBackend.QUITO
     accelerator_quito = Accelerator(backend_quito)
-    accelerator = AcceleratorGroup([accelerator_belem, accelerator_quito])
 
     circuit = create_quantum_only_ghz(7)
     circuit = optimize_circuit_offline(circuit, backend_belem)
     experiments, uuid = cut_circuit(circuit, [3,4])
-    experiments = accelerator.run_experiments(experiments)
+    with AcceleratorGroup([accelerator_belem, accelerator_quito]) as accelerator:
+        experiments = accelerator.run_experiments(experiments)
 
     exp_vals = reconstruct_expvals(list(filter(lambda x: x.uuid == uuid, experiments)))
     assert len(exp_vals) == 1
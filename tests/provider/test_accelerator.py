@@ -1,9 +1,15 @@
 """Tests for Accelerator."""
 
+import numpy as np
 from pytest import approx
+from qiskit import QuantumCircuit
+from qiskit.circuit import Gate
+from qiskit.extensions import UnitaryGate
+from qiskit.quantum_info import random_unitary
 
 from src.circuits import create_ghz
 from src.provider import Accelerator, IBMQBackend
+from src.provider import accelerator as accelerator_module
 from src.tools import optimize_circuit_offline
 
 
@@ -17,3 +23,39 @@ def test_accelerator_run() -> None:
     assert len(counts) == 2**3
     assert counts["000"] / 1024 == approx(0.5, 0.2)
     assert counts["111"] / 1024 == approx(0.5, 0.2)
+
+
+def test_accelerator_processing_time_cache(monkeypatch) -> None:
+    """_summary_"""
+    accelerator = Accelerator(IBMQBackend.BELEM)
+    accelerator.compute_processing_time(create_ghz(3))
+    accelerator.compute_processing_time(create_ghz(3))
+    assert len(accelerator._processing_times) == 1
+
+    # Parameters are keyed by value
+    for angle in (0.1, 0.2):
+        circuit = QuantumCircuit(1)
+        circuit.rx(angle, 0)
+        accelerator.compute_processing_time(circuit)
+    assert len(accelerator._processing_times) == 3
+
+    # Array parameters and custom definitions are not cached
+    for seed in (1, 2):
+        circuit = QuantumCircuit(2)
+        circuit.append(UnitaryGate(random_unitary(4, seed=seed)), [0, 1])
+        accelerator.compute_processing_time(circuit)
+    custom_definition = QuantumCircuit(1)
+    custom_definition.h(0)
+    custom_x = Gate("x", 1, [])
+    custom_x.definition = custom_definition
+    circuit = QuantumCircuit(1)
+    circuit.append(custom_x, [0])
+    accelerator.compute_processing_time(circuit)
+    assert len(accelerator._processing_times) == 3
+
+    # The cache is bounded
+    monkeypatch.setattr(accelerator_module, "_PROCESSING_TIMES_SIZE", 2)
+    circuit = QuantumCircuit(1)
+    circuit.rx(np.pi, 0)
+    accelerator.compute_processing_time(circuit)
+    assert len(accelerator._processing_times) == 2
@@ -1,12 +1,49 @@
 """AccelertorGroup Tests."""
+from threading import Lock
+import time
+
 import pytest
-from qiskit import transpile
+from qiskit import QuantumCircuit, transpile
 from qiskit.transpiler.exceptions import TranspilerError
 
 from src.circuits import create_ghz
+from src.common import CombinedJob, ScheduledJob
 from src.provider import Accelerator, AcceleratorGroup, IBMQBackend
 
 
+class _TaggedAccelerator(Accelerator):
+    """Accelerator whose counts tell which accelerator produced them."""
+
+    def __init__(self, backend: IBMQBackend, tag: str) -> None:
+        super().__init__(backend)
+        self.tag = tag
+
+    def run_and_get_counts(
+        self, circuit: QuantumCircuit, n_shots: int = 2**10
+    ) -> dict[str, int]:
+        return {self.tag: n_shots}
+
+
+class _ConcurrencyAccelerator(Accelerator):
+    """Accelerator that records how many runs use its simulator at once."""
+
+    lock = Lock()
+    active: dict[int, int] = {}
+    peak: dict[int, int] = {}
+
+    def run_and_get_counts(
+        self, circuit: QuantumCircuit, n_shots: int = 2**10
+    ) -> dict[str, int]:
+        key = id(self.simulator)
+        with self.lock:
+            self.active[key] = self.active.get(key, 0) + 1
+            self.peak[key] = max(self.peak.get(key, 0), self.active[key])
+        time.sleep(0.05)
+        with self.lock:
+            self.active[key] -= 1
+        return {"0": n_shots}
+
+
 # @pytest.mark.skip(
 #     reason="Error does not get raised if transpile is not done in accelerator."
 # )
@@ -24,3 +61,42 @@ def test_acceleratorgroup_run() -> None:
                 transpile(create_ghz(7), backend_quito.value()),
             ]
         )
+
+
+def test_acceleratorgroup_run_jobs() -> None:
+    """_summary_"""
+    accelerators = [
+        _TaggedAccelerator(IBMQBackend.BELEM, "belem"),
+        _TaggedAccelerator(IBMQBackend.QUITO, "quito"),
+        _TaggedAccelerator(IBMQBackend.BELEM, "belem_2"),
+    ]
+    jobs = [
+        ScheduledJob(job=CombinedJob(circuit=create_ghz(2), n_shots=idx + 1), qpu=qpu)
+        for idx, qpu in enumerate([0, 1, 2, 1, 0, 2, 2])
+    ]
+    with AcceleratorGroup(accelerators) as accelerator:
+        results = accelerator.run_jobs(jobs)
+
+    assert len(results) == len(jobs)
+    for job, result in zip(jobs, results):
+        assert result is job.job
+        assert result.result_counts == {
+            accelerators[job.qpu].tag: job.job.n_shots
+        }
+
+
+def test_acceleratorgroup_run_shared_simulator() -> None:
+    """_summary_"""
+    accelerators = [
+        _ConcurrencyAccelerator(IBMQBackend.BELEM),
+        _ConcurrencyAccelerator(IBMQBackend.BELEM),
+        _ConcurrencyAccelerator(IBMQBackend.QUITO),
+    ]
+    assert accelerators[0].simulator is accelerators[1].simulator
+    counts = AcceleratorGroup(accelerators).run_and_get_counts(
+        [create_ghz(2) for _ in accelerators]
+    )
+    assert counts == [{"0": 2**10}] * 3
+    # Runs on a shared simulator never overlap
+    assert set(_ConcurrencyAccelerator.peak.values()) == {1}
+    assert len(_ConcurrencyAccelerator.peak) == 2
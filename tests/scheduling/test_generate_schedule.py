@@ -3,7 +3,13 @@
 from src.circuits import create_ghz
 from src.common import IBMQBackend, job_from_circuit
 from src.provider import Accelerator
-from src.scheduling import generate_schedule, SchedulerType, ExecutableProblem
+from src.scheduling import (
+    generate_schedule,
+    SchedulerType,
+    ExecutableProblem,
+    InfoProblem,
+    set_up_base_lp,
+)
 
 
 def test_generate_schedule() -> None:
@@ -18,3 +24,52 @@ def test_generate_schedule() -> None:
     schedule = generate_schedule(problem, SchedulerType.SIMPLE)
     assert isinstance(schedule, list)
     assert len(schedule) <= 4
+
+
+def test_generate_schedule_single_job() -> None:
+    """_summary_"""
+    problem = InfoProblem(
+        base_jobs=[create_ghz(3)],
+        accelerators={"belem": 5, "quito": 5},
+        big_m=100,
+        timesteps=20,
+        process_times=[[2.0, 3.0]],
+        setup_times=[[[50.0, 50.0], [50.0, 50.0]], [[0.0, 0.0], [50.0, 50.0]]],
+    )
+
+    makespan, jobs, _ = generate_schedule(problem, SchedulerType.SIMPLE)
+    assert len(jobs) == 1
+    assert jobs[0].machine in problem.accelerators
+    assert makespan == jobs[0].completion_time
+
+
+def test_generate_schedule_shared_base_lp() -> None:
+    """_summary_"""
+    problem = InfoProblem(
+        base_jobs=[create_ghz(2), create_ghz(3), create_ghz(2)],
+        accelerators={"belem": 5, "quito": 5},
+        big_m=100,
+        timesteps=20,
+        process_times=[[2.0, 3.0], [4.0, 1.0], [3.0, 3.0]],
+        setup_times=[
+            [[50.0, 50.0], [50.0, 50.0], [50.0, 50.0], [50.0, 50.0]],
+            [[0.0, 0.0], [50.0, 50.0], [1.0, 2.0], [2.0, 1.0]],
+            [[0.0, 0.0], [2.0, 1.0], [50.0, 50.0], [1.0, 1.0]],
+            [[0.0, 0.0], [1.0, 2.0], [2.0, 2.0], [50.0, 50.0]],
+        ],
+    )
+    base_lp = set_up_base_lp(
+        problem.base_jobs, problem.accelerators, problem.big_m, problem.timesteps
+    )
+
+    _, _, simple_lp = generate_schedule(problem, SchedulerType.SIMPLE, base_lp)
+    simple_values = {var.name: var.varValue for var in simple_lp.problem.variables()}
+    _, _, extended_lp = generate_schedule(problem, SchedulerType.EXTENDED, base_lp)
+
+    # Solving the extended LP must not overwrite the simple solution
+    assert {
+        var.name: var.varValue for var in simple_lp.problem.variables()
+    } == simple_values
+    simple_ids = {id(var) for var in simple_lp.problem.variables()}
+    assert not simple_ids & {id(var) for var in extended_lp.problem.variables()}
+    assert all(var.varValue is None for var in base_lp.problem.variables())
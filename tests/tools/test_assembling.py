@@ -1,4 +1,7 @@
 """"""
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.quantum_info import PauliList
+
 from src.circuits import create_ghz, create_quantum_only_ghz
 from src.common import jobs_from_experiment, IBMQBackend
 from src.tools import (
@@ -7,6 +10,32 @@ from src.tools import (
     cut_circuit,
     optimize_circuit_offline,
 )
+from src.tools.assembling import _combine_observables, _needs_compose
+
+
+def _compose_reference(circuits: list[QuantumCircuit]) -> QuantumCircuit:
+    """Assembles the circuits with `QuantumCircuit.compose` only."""
+    composed_circuit = QuantumCircuit()
+    for idx, circuit in enumerate(circuits):
+        for creg in circuit.cregs:
+            composed_circuit.add_register(
+                ClassicalRegister(creg.size, f"{idx}_{creg.name}")
+            )
+        for qreg in circuit.qregs:
+            composed_circuit.add_register(
+                QuantumRegister(qreg.size, f"{idx}_{qreg.name}")
+            )
+    qubits, clbits = 0, 0
+    for circuit in circuits:
+        composed_circuit.compose(
+            circuit,
+            qubits=list(range(qubits, qubits + circuit.num_qubits)),
+            clbits=list(range(clbits, clbits + circuit.num_clbits)),
+            inplace=True,
+        )
+        qubits += circuit.num_qubits
+        clbits += circuit.num_clbits
+    return composed_circuit
 
 
 def test_assemble_circuit() -> None:
@@ -31,3 +60,46 @@ def test_assemble_and_reconstruct_job() -> None:
     combined_job = assemble_job([jobs[0], jobs[6]])
     assert combined_job.circuit.num_qubits == 5
     assert len(combined_job.observable[0]) == 5
+
+
+def test_assemble_circuit_matches_compose() -> None:
+    """_summary_"""
+    phased = create_quantum_only_ghz(2)
+    phased.global_phase = 0.5
+    two_cregs = QuantumCircuit(
+        QuantumRegister(2, "q"), ClassicalRegister(1, "a"), ClassicalRegister(1, "b")
+    )
+    two_cregs.h(0)
+    two_cregs.measure([0, 1], [1, 0])
+    cases = [
+        [create_quantum_only_ghz(3), phased],
+        [create_ghz(3), two_cregs, create_ghz(2)],
+    ]
+    for circuits in cases:
+        assert not any(_needs_compose(circuit) for circuit in circuits)
+        assert assemble_circuit(circuits) == _compose_reference(circuits)
+
+
+def test_assemble_circuit_conditional_fallback() -> None:
+    """_summary_"""
+    conditional = create_ghz(2)
+    conditional.x(0).c_if(conditional.cregs[0], 1)
+    assert _needs_compose(conditional)
+    circuits = [create_ghz(3), conditional]
+    assert assemble_circuit(circuits) == _compose_reference(circuits)
+
+
+def test_combine_observables_matches_expand() -> None:
+    """_summary_"""
+    cases = [
+        [PauliList("ZZ"), PauliList("XYZ")],
+        [PauliList("-iXZ"), PauliList("iZ"), PauliList("-Y")],
+    ]
+    for observables in cases:
+        expected = PauliList("")
+        for observable in observables:
+            expected = expected.expand(observable)
+        combined = _combine_observables(observables)
+        assert combined == expected
+        assert (combined.phase == expected.phase).all()
+    assert (_combine_observables(cases[1]).phase != 0).any()